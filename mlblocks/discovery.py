@@ -8,6 +8,7 @@ annotations, as well as to configure how MLBlocks finds the
 primitives and pipelines.
 """
 
+import functools
 import json
 import logging
 import os
@@ -16,6 +17,11 @@ import sys
 
 import pkg_resources
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
 _PRIMITIVES_PATHS = [
@@ -29,6 +35,12 @@ _PIPELINES_PATHS = [
     os.path.join(os.getcwd(), 'mlpipelines'),
 ]
 
+# Paths of the JSON annotations already found, by name and lookup paths.
+_ANNOTATION_PATHS = dict()
+
+# Folders published by the entry points, by entry point name and group.
+_ENTRY_POINT_PATHS = dict()
+
 
 def _add_lookup_path(path, paths):
     """Add a new path to lookup.
@@ -122,6 +134,9 @@ def _load_entry_points(entry_point_name, entry_point_group='mlblocks'):
 
         SOME_VARIABLE = os.path.join(os.path.dirname(__file__), 'jsons')
 
+    Scanning the entry points is slow, so the folders found are cached and
+    the entry points are only scanned once for each name and group.
+
     Args:
         entry_point:
             The name of the ``entry_point`` to look for.
@@ -130,17 +145,22 @@ def _load_entry_points(entry_point_name, entry_point_group='mlblocks'):
         list:
             The list of folders.
     """
-    lookup_paths = list()
-    entry_points = pkg_resources.iter_entry_points(entry_point_group)
-    for entry_point in entry_points:
-        if entry_point.name == entry_point_name:
-            paths = entry_point.load()
-            if isinstance(paths, str):
-                lookup_paths.append(paths)
-            elif isinstance(paths, (list, tuple)):
-                lookup_paths.extend(paths)
+    key = (entry_point_name, entry_point_group)
+    lookup_paths = _ENTRY_POINT_PATHS.get(key)
+    if lookup_paths is None:
+        lookup_paths = list()
+        entry_points = pkg_resources.iter_entry_points(entry_point_group)
+        for entry_point in entry_points:
+            if entry_point.name == entry_point_name:
+                paths = entry_point.load()
+                if isinstance(paths, str):
+                    lookup_paths.append(paths)
+                elif isinstance(paths, (list, tuple)):
+                    lookup_paths.extend(paths)
 
-    return lookup_paths
+        _ENTRY_POINT_PATHS[key] = lookup_paths
+
+    return list(lookup_paths)
 
 
 def get_primitives_paths():
@@ -198,10 +218,35 @@ def get_pipelines_paths():
     return _PIPELINES_PATHS + _load_entry_points('pipelines')
 
 
+@functools.lru_cache(maxsize=256)
+def _read_json_file(json_path, mtime, size):
+    """Read the contents of a JSON file, caching them by path, mtime and size.
+
+    Only the raw contents are cached: parsing them again is cheaper than
+    deep copying the parsed dict, and each caller gets its own copy.
+    """
+    with open(json_path, 'rb') as json_file:
+        return json_file.read()
+
+
 def _load_json(json_path):
-    with open(json_path, 'r') as json_file:
-        LOGGER.debug('Loading %s', json_path)
-        return json.load(json_file)
+    """Load a JSON file, using ``orjson`` to parse it if available.
+
+    ``orjson`` is stricter than the ``json`` module, which is used as
+    a fallback for the files that it cannot parse, such as the ones
+    which contain ``NaN`` values.
+    """
+    LOGGER.debug('Loading %s', json_path)
+    stat = os.stat(json_path)
+    data = _read_json_file(json_path, stat.st_mtime_ns, stat.st_size)
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data)
 
 
 def _load(name, paths):
@@ -216,6 +261,9 @@ def _load(name, paths):
         paths (list):
             list of paths where the primitives will be looked for.
 
+    The path where each annotation is found is remembered, so the paths
+    are only scanned again if the file is removed or the paths change.
+
     Returns:
         dict:
             The content of the JSON annotation file loaded into a dict.
@@ -223,6 +271,14 @@ def _load(name, paths):
     if os.path.isfile(name):
         return _load_json(name)
 
+    key = (name, tuple(paths))
+    json_path = _ANNOTATION_PATHS.get(key)
+    if json_path is not None:
+        try:
+            return _load_json(json_path)
+        except FileNotFoundError:
+            del _ANNOTATION_PATHS[key]
+
     for base_path in paths:
         parts = name.split('.')
         number_of_parts = len(parts)
@@ -233,6 +289,7 @@ def _load(name, paths):
             json_path = os.path.join(folder, filename)
 
             if os.path.isfile(json_path):
+                _ANNOTATION_PATHS[key] = json_path
                 return _load_json(json_path)
 
 
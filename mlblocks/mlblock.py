@@ -2,6 +2,7 @@
 
 """Package where the MLBlock class is defined."""
 
+import functools
 import importlib
 import logging
 from copy import deepcopy
@@ -10,20 +11,29 @@ from mlblocks.discovery import load_primitive
 
 LOGGER = logging.getLogger(__name__)
 
+# Types of the hyperparameter values that can be shared instead of deep copied.
+_IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, type(None))
+
+
+@functools.lru_cache(maxsize=None)
+def _import_object_by_name(object_name):
+    """Import an object from its Fully Qualified Name, caching the result."""
+    parent_name, attribute = object_name.rsplit('.', 1)
+    try:
+        parent = importlib.import_module(parent_name)
+    except ImportError:
+        grand_parent_name, parent_name = parent_name.rsplit('.', 1)
+        grand_parent = importlib.import_module(grand_parent_name)
+        parent = getattr(grand_parent, parent_name)
+
+    return getattr(parent, attribute)
+
 
 def import_object(object_name):
     """Import an object from its Fully Qualified Name."""
 
     if isinstance(object_name, str):
-        parent_name, attribute = object_name.rsplit('.', 1)
-        try:
-            parent = importlib.import_module(parent_name)
-        except ImportError:
-            grand_parent_name, parent_name = parent_name.rsplit('.', 1)
-            grand_parent = importlib.import_module(grand_parent_name)
-            parent = getattr(grand_parent, parent_name)
-
-        return getattr(parent, attribute)
+        return _import_object_by_name(object_name)
 
     return object_name
 
@@ -225,7 +235,11 @@ class MLBlock():
                 the dictionary containing the hyperparameter values that the
                 MLBlock is currently using.
         """
-        return deepcopy(self._hyperparameters)
+        # Only the mutable values need to be deep copied, and most are scalars.
+        return {
+            name: value if type(value) in _IMMUTABLE_TYPES else deepcopy(value)
+            for name, value in self._hyperparameters.items()
+        }
 
     def set_hyperparameters(self, hyperparameters):
         """Set new hyperparameters.
@@ -233,20 +247,38 @@ class MLBlock():
         Only the specified hyperparameters are modified, so any other
         hyperparameter keeps the value that had been previously given.
 
-        If necessary, a new instance of the primitive is created.
+        If necessary, a new instance of the primitive is created. If all the
+        given values are immutable and equal to the current ones, the current
+        instance is kept.
 
         Args:
             hyperparameters (dict):
                 Dictionary containing as keys the name of the hyperparameters and as
                 values the values to be used.
         """
+        changed = not hasattr(self, 'instance') or any(
+            not self._is_current_value(name, value)
+            for name, value in hyperparameters.items()
+        )
         self._hyperparameters.update(hyperparameters)
 
-        if self._class:
+        if self._class and changed:
             LOGGER.debug('Creating a new primitive instance for %s', self.name)
             self.instance = self.primitive(**self.get_hyperparameters())
 
-    def _get_method_kwargs(self, kwargs, method_args):
+    def _is_current_value(self, name, value):
+        """Tell whether the given value is the current value of the hyperparameter.
+
+        Only immutable values are compared, since mutable ones may have been
+        modified in place after being set.
+        """
+        if type(value) not in _IMMUTABLE_TYPES or name not in self._hyperparameters:
+            return False
+
+        current = self._hyperparameters[name]
+        return type(current) is type(value) and current == value
+
+    def _get_method_kwargs(self, kwargs, method_args, params):
         """Prepare the kwargs for the method.
 
         The kwargs dict will be altered according to the method_kwargs
@@ -258,6 +290,9 @@ class MLBlock():
                 keyword arguments that have been passed to the block method.
             method_args (list):
                 method arguments as specified in the JSON annotation.
+            params (dict):
+                arguments given during the MLBlock initialization, which are
+                used for the ones not found in ``kwargs``.
 
         Returns:
             dict:
@@ -274,6 +309,8 @@ class MLBlock():
 
             if name in kwargs:
                 value = kwargs[name]
+            elif name in params:
+                value = params[name]
             elif 'default' in arg:
                 value = arg['default']
             elif arg.get('required', True):
@@ -305,9 +342,7 @@ class MLBlock():
                 method is given.
         """
         if self.fit_method is not None:
-            fit_kwargs = self._fit_params.copy()
-            fit_kwargs.update(kwargs)
-            fit_kwargs = self._get_method_kwargs(fit_kwargs, self.fit_args)
+            fit_kwargs = self._get_method_kwargs(kwargs, self.fit_args, self._fit_params)
             getattr(self.instance, self.fit_method)(**fit_kwargs)
 
     def produce(self, **kwargs):
@@ -324,9 +359,7 @@ class MLBlock():
             The output of the call to the primitive function or primitive
             produce method.
         """
-        produce_kwargs = self._produce_params.copy()
-        produce_kwargs.update(kwargs)
-        produce_kwargs = self._get_method_kwargs(produce_kwargs, self.produce_args)
+        produce_kwargs = self._get_method_kwargs(kwargs, self.produce_args, self._produce_params)
         if self._class:
             return getattr(self.instance, self.produce_method)(**produce_kwargs)
 
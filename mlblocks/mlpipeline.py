@@ -2,14 +2,21 @@
 
 """Package where the MLPipeline class is defined."""
 
+import asyncio
+import copy
+import functools
 import json
 import logging
 import os
-import re
+import pickle
+import sys
 import warnings
-from collections import Counter, OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from copy import deepcopy
 from datetime import datetime
+from itertools import islice
 
 import numpy as np
 import psutil
@@ -18,8 +25,129 @@ from graphviz import Digraph
 from mlblocks.discovery import load_pipeline
 from mlblocks.mlblock import MLBlock
 
+try:
+    import joblib
+except ImportError:
+    joblib = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
+# Conversions of the common scalar types to their python equivalents, indexed by type.
+_SCALAR_TYPES = {int: int, float: float, bool: bool, np.bool_: bool}
+_SCALAR_TYPES.update(
+    (numpy_type, int) for numpy_type in (
+        np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64
+    )
+)
+_SCALAR_TYPES.update(
+    (numpy_type, float) for numpy_type in (np.float16, np.float32, np.float64)
+)
+
+# Attributes of MLPipeline that are only caches, so they are not pickled.
+_CACHE_ATTRIBUTES = ('_block_variables', '_variables_plans', '_block_dependencies')
+
+# Arguments of ``fit`` and ``predict`` that ``fit_parallel`` and ``predict_parallel``
+# do not support, since they require running the blocks one after the other.
+_SEQUENTIAL_ARGUMENTS = ('output_', 'start_', 'debug', 'copy_outputs')
+
+# Attributes of MLPipeline that hold the block results cache, which is
+# bound to the process that created it, so they are not pickled either.
+_MEMORY_ATTRIBUTES = ('memory', 'memoize_steps', '_fit_one', '_produce_one')
+
+# Attributes that older versions of MLPipeline had, which may be found in old pickles.
+_REMOVED_ATTRIBUTES = ('_re_block_name', )
+
+# Shared default for the per-block ``input_names``, ``output_names`` and
+# ``init_params`` lookups, which avoids creating an empty dict on each miss.
+# It ends up stored in the caches, so it is a plain dict to keep them
+# picklable, and it must never be modified.
+_EMPTY_DICT = dict()
+
+
+def _loads(data):
+    """Deserialize JSON bytes, using ``orjson`` if available.
+
+    ``orjson`` is stricter than the ``json`` module, which is used as a fallback
+    for the data that it cannot parse, such as ``NaN`` hyperparameter values.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data)
+
+
+def _fit_one(block, fit_args):
+    """Fit the block and return it, so the fitted block can be memoized."""
+    block.fit(**fit_args)
+    return block
+
+
+def _produce_one(block, produce_args):
+    """Call the block produce method. Used to memoize the block outputs."""
+    return block.produce(**produce_args)
+
+
+class _MappingMemory:
+    """Adapt a dict-like store to the ``cache`` interface of ``joblib.Memory``.
+
+    The results are looked up by the hash of the function name and its arguments,
+    which include the block with its hyperparameters and fitted state, and are
+    stored pickled, so the cached values are never shared between pipelines.
+
+    Args:
+        store (MutableMapping):
+            Dict-like object where the results are stored, such as a ``dict``
+            or an LRU cache.
+    """
+
+    def __init__(self, store):
+        if joblib is None:
+            raise ImportError('joblib is required to use a dict-like memory')
+
+        self.store = store
+
+    def cache(self, function):
+        return _MappedFunction(self.store, function)
+
+
+class _MappedFunction:
+    """Function call cached in a dict-like store. See ``_MappingMemory``."""
+
+    def __init__(self, store, function):
+        self.store = store
+        self.function = function
+
+    def __call__(self, *args):
+        key = joblib.hash((self.function.__name__, args))
+        result = self.store.get(key)
+        if result is None:
+            result = pickle.dumps(self.function(*args))
+            self.store[key] = result
+
+        return pickle.loads(result)
+
+
+def _get_list_pipeline_dict(pipeline, primitives):
+    if primitives is not None:
+        raise ValueError('if `pipeline` is a `list`, `primitives` must be `None`')
+
+    return {'primitives': pipeline}
+
+
+def _get_none_pipeline_dict(pipeline, primitives):
+    if primitives is None:
+        raise ValueError('Either `pipeline` or `primitives` must be not `None`.')
+
+    return dict()
+
 
 class MLPipeline():
     """MLPipeline Class.
@@ -84,21 +212,56 @@ class MLPipeline():
         verbose (bool):
             whether to log the exceptions that occur when running the pipeline before
             raising them or not.
+        memory (str or object):
+            Used to cache the fitted blocks and their outputs. If a string is given, it is
+            interpreted as the path to the caching directory of a ``joblib.Memory``. A
+            dict-like object, such as an LRU cache, can be given to keep the cache in
+            memory. Any other object with the ``joblib.Memory`` interface can be passed
+            as well. By default, no caching is performed. The cache is not pickled
+            with the pipeline, so unpickled pipelines do not use it.
+        memoize_steps (list):
+            Names of the blocks whose fit and produce calls will be cached when ``memory``
+            is given. If not given, all the blocks are cached. Caching requires hashing the
+            block inputs, so it only pays off for the expensive blocks.
     """
 
+    __slots__ = (
+        'primitives', 'init_params', '_blocks', 'input_names', 'output_names', 'outputs',
+        'verbose', 'memory', 'memoize_steps', '_last_fit_block', '_last_block_name',
+        '_block_names', '_block_index', '_block_variables', '_variables_plans',
+        '_block_dependencies', '_tunable_hyperparameters',
+        '_fit_one', '_produce_one', '__weakref__',
+    )
+
+    @property
+    def blocks(self):
+        """OrderedDict: The blocks of this pipeline, by name."""
+        return self._blocks
+
+    @blocks.setter
+    def blocks(self, blocks):
+        # The block names lookups are derived from the blocks, so they are rebuilt here
+        block_names = tuple(blocks.keys())
+        self._last_block_name = block_names[-1]
+        self._blocks = blocks
+        self._block_names = block_names
+        self._block_index = {
+            block_name: index
+            for index, block_name in enumerate(block_names)
+        }
+
     def _get_tunable_hyperparameters(self):
         """Get the tunable hyperperparameters from all the blocks in this pipeline."""
-        tunable = {}
-        for block_name, block in self.blocks.items():
-            tunable[block_name] = block.get_tunable_hyperparameters()
-
-        return tunable
+        return {
+            block_name: block.get_tunable_hyperparameters()
+            for block_name, block in self.blocks.items()
+        }
 
     def _build_blocks(self):
         blocks = OrderedDict()
         last_fit_block = None
 
-        block_names_count = Counter()
+        block_names_count = dict()
         for primitive in self.primitives:
             if isinstance(primitive, str):
                 primitive_name = primitive
@@ -106,12 +269,13 @@ class MLPipeline():
                 primitive_name = primitive['name']
 
             try:
-                block_names_count.update([primitive_name])
-                block_count = block_names_count[primitive_name]
-                block_name = '{}#{}'.format(primitive_name, block_count)
-                block_params = self.init_params.get(block_name, dict())
+                block_count = block_names_count.get(primitive_name, 0) + 1
+                block_names_count[primitive_name] = block_count
+                # Block names are used as keys in most of the pipeline lookups
+                block_name = sys.intern(f'{primitive_name}#{block_count}')
+                block_params = self.init_params.get(block_name, _EMPTY_DICT)
                 if not block_params:
-                    block_params = self.init_params.get(primitive_name, dict())
+                    block_params = self.init_params.get(primitive_name, _EMPTY_DICT)
                     if block_params and block_count > 1:
                         LOGGER.warning(('Non-numbered init_params are being used '
                                         'for more than one block %s.'), primitive_name)
@@ -130,42 +294,33 @@ class MLPipeline():
 
     @staticmethod
     def _get_pipeline_dict(pipeline, primitives):
-        if isinstance(pipeline, dict):
-            return pipeline
-
-        elif isinstance(pipeline, str):
-            return load_pipeline(pipeline)
-
-        elif isinstance(pipeline, MLPipeline):
-            return pipeline.to_dict()
-
-        elif isinstance(pipeline, list):
-            if primitives is not None:
-                raise ValueError('if `pipeline` is a `list`, `primitives` must be `None`')
-
-            return {'primitives': pipeline}
-
-        elif pipeline is None:
-            if primitives is None:
-                raise ValueError('Either `pipeline` or `primitives` must be not `None`.')
+        builder = _PIPELINE_DICT_BUILDERS.get(type(pipeline))
+        if builder is not None:
+            return builder(pipeline, primitives)
 
-            return dict()
+        # Subclasses of the supported types
+        for pipeline_type, builder in _PIPELINE_DICT_BUILDERS.items():
+            if isinstance(pipeline, pipeline_type):
+                return builder(pipeline, primitives)
 
     def _get_block_outputs(self, block_name):
         """Get the list of output variables for the given block."""
         outputs = self._get_block_variables(
             block_name,
             'produce_output',
-            self.output_names.get(block_name, dict())
+            self.output_names.get(block_name, _EMPTY_DICT)
         )
-        for context_name, output in outputs.items():
-            output['variable'] = '{}.{}'.format(block_name, context_name)
-
-        return list(outputs.values())
+        return [
+            dict(output, variable=f'{block_name}.{context_name}')
+            for context_name, output in outputs.items()
+        ]
 
     def _get_block_variables(self, block_name, variables_attr, names):
         """Get dictionary of variable names to the variable for a given block
 
+        The result is cached until either the variables specification of the block
+        or the given names dictionary are replaced, so it must not be modified.
+
         Args:
             block_name (str):
                 Name of the block for which to get the specification
@@ -176,9 +331,16 @@ class MLPipeline():
                 Dictionary used to translate the variable names.
         """
         block = self.blocks[block_name]
-        variables = deepcopy(getattr(block, variables_attr))
+        variables = getattr(block, variables_attr)
         if isinstance(variables, str):
+            # The variables are computed by the primitive instance, so they cannot be cached
             variables = getattr(block.instance, variables)()
+            cache_key = None
+        else:
+            cache_key = (block_name, variables_attr)
+            cached = self._block_variables.get(cache_key)
+            if cached is not None and cached[0] is variables and cached[1] is names:
+                return cached[2]
 
         variable_dict = {}
         for variable in variables:
@@ -186,6 +348,9 @@ class MLPipeline():
             context_name = names.get(name, name)
             variable_dict[context_name] = variable
 
+        if cache_key is not None:
+            self._block_variables[cache_key] = (variables, names, variable_dict)
+
         return variable_dict
 
     def _get_outputs(self, pipeline, outputs):
@@ -203,26 +368,76 @@ class MLPipeline():
 
         return outputs
 
+    @staticmethod
+    def _get_memory(memory):
+        if memory is None or hasattr(memory, 'cache'):
+            return memory
+
+        if isinstance(memory, str):
+            if joblib is None:
+                raise ImportError('joblib is required to use a memory location')
+
+            return joblib.Memory(location=memory, verbose=0)
+
+        if isinstance(memory, MutableMapping):
+            return _MappingMemory(memory)
+
+        raise ValueError('memory must be None, a str, a dict-like or a joblib.Memory instance')
+
     def _get_block_name(self, index):
         """Get the name of the block in the ``index`` position."""
-        return list(self.blocks.keys())[index]
+        return self._block_names[index]
+
+    def _get_start_index(self, start_):
+        """Get the position of the block to start from.
+
+        Args:
+            start_ (str or int):
+                Block index or block name to start processing from.
+
+        Returns:
+            int:
+                The position of the block in the pipeline.
+
+        Raises:
+            ValueError:
+                If the block name is not valid.
+        """
+        if isinstance(start_, int):
+            start_ = self._get_block_name(start_)
+
+        start_index = self._block_index.get(start_)
+        if start_index is None:
+            raise ValueError(f'Unknown block name: {start_}')
+
+        return start_index
 
     def __init__(self, pipeline=None, primitives=None, init_params=None,
-                 input_names=None, output_names=None, outputs=None, verbose=True):
+                 input_names=None, output_names=None, outputs=None, verbose=True,
+                 memory=None, memoize_steps=None):
 
         pipeline = self._get_pipeline_dict(pipeline, primitives)
 
         self.primitives = primitives or pipeline['primitives']
         self.init_params = init_params or pipeline.get('init_params', dict())
         self.blocks, self._last_fit_block = self._build_blocks()
-        self._last_block_name = self._get_block_name(-1)
+        self._block_variables = dict()
+        self._variables_plans = dict()
+        self._block_dependencies = dict()
 
         self.input_names = input_names or pipeline.get('input_names', dict())
         self.output_names = output_names or pipeline.get('output_names', dict())
+        self._build_variables_plans()
 
         self.outputs = self._get_outputs(pipeline, outputs)
         self.verbose = verbose
 
+        self.memory = self._get_memory(memory)
+        self.memoize_steps = memoize_steps
+        if self.memory is not None:
+            self._fit_one = self.memory.cache(_fit_one)
+            self._produce_one = self.memory.cache(_produce_one)
+
         tunable = pipeline.get('tunable_hyperparameters')
         if tunable is not None:
             self._tunable_hyperparameters = tunable
@@ -233,7 +448,35 @@ class MLPipeline():
         if hyperparameters:
             self.set_hyperparameters(hyperparameters)
 
-        self._re_block_name = re.compile(r'(^[^#]+#\d+)(\..*)?')
+    def __getstate__(self):
+        """Get the state of the pipeline to pickle it, leaving the caches out."""
+        state = dict(getattr(self, '__dict__', _EMPTY_DICT))
+        for name in MLPipeline.__slots__:
+            if name in _CACHE_ATTRIBUTES or name in _MEMORY_ATTRIBUTES:
+                continue
+
+            if name != '__weakref__' and hasattr(self, name):
+                state[name] = getattr(self, name)
+
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of a pickled pipeline and rebuild its caches.
+
+        Pipelines pickled before ``__slots__`` was introduced may lack some of
+        the attributes added afterwards, so the missing ones are rebuilt too,
+        and may have attributes which no longer exist, which are ignored.
+        The restored pipeline does not cache the block results.
+        """
+        for name, value in state.items():
+            if name not in _REMOVED_ATTRIBUTES and name not in _MEMORY_ATTRIBUTES:
+                setattr(self, name, value)
+
+        for name in _CACHE_ATTRIBUTES:
+            setattr(self, name, dict())
+
+        self.memory = None
+        self.memoize_steps = None
 
     def _get_str_output(self, output):
         """Get the outputs that correspond to the str specification."""
@@ -246,17 +489,15 @@ class MLPipeline():
             block_name, variable_name = output.rsplit('.', 1)
             block = self.blocks.get(block_name)
             if not block:
-                raise ValueError('Invalid block name: {}'.format(block_name))
+                raise ValueError(f'Invalid block name: {block_name}')
 
             for variable in block.produce_output:
                 if variable['name'] == variable_name:
-                    output_variable = deepcopy(variable)
-                    output_variable['variable'] = output
-                    return [output_variable]
+                    return [dict(variable, variable=output)]
 
-            raise ValueError('Block {} has no output {}'.format(block_name, variable_name))
+            raise ValueError(f'Block {block_name} has no output {variable_name}')
 
-        raise ValueError('Invalid Output Specification: {}'.format(output))
+        raise ValueError(f'Invalid Output Specification: {output}')
 
     def get_inputs(self, fit=True):
         """Get a relation of all the input variables required by this pipeline.
@@ -276,32 +517,43 @@ class MLPipeline():
                 pipeline inputs specification.
         """
         inputs = dict()
-        for block_name in reversed(self.blocks.keys()):  # iterates through pipeline backwards
-            produce_outputs = self._get_block_variables(
-                block_name,
-                'produce_output',
-                self.output_names.get(block_name, dict())
-            )
-
-            for produce_output_name in produce_outputs.keys():
-                inputs.pop(produce_output_name, None)
-
+        produced = set()
+        for block_name in self._block_names:
+            # A variable is an input if it is read before any block produces it.
+            # The specification from the first block that reads it is kept.
             produce_inputs = self._get_block_variables(
                 block_name,
                 'produce_args',
-                self.input_names.get(block_name, dict())
+                self.input_names.get(block_name, _EMPTY_DICT)
             )
-            inputs.update(produce_inputs)
+            block_inputs = {
+                name: variable
+                for name, variable in produce_inputs.items()
+                if name not in produced and name not in inputs
+            }
 
             if fit:
                 fit_inputs = self._get_block_variables(
                     block_name,
                     'fit_args',
-                    self.input_names.get(block_name, dict())
+                    self.input_names.get(block_name, _EMPTY_DICT)
+                )
+                block_inputs.update(
+                    (name, variable)
+                    for name, variable in fit_inputs.items()
+                    if name not in produced and name not in inputs
                 )
-                inputs.update(fit_inputs)
 
-        return inputs
+            inputs.update(block_inputs)
+
+            produce_outputs = self._get_block_variables(
+                block_name,
+                'produce_output',
+                self.output_names.get(block_name, _EMPTY_DICT)
+            )
+            produced.update(produce_outputs)
+
+        return {name: dict(variable) for name, variable in inputs.items()}
 
     def get_fit_args(self):
         return list(self.get_inputs(fit=True).values())
@@ -405,17 +657,32 @@ class MLPipeline():
         outputs = self.get_outputs(outputs)
         return [output['variable'] for output in outputs]
 
-    def _extract_block_name(self, variable_name):
-        return self._re_block_name.search(variable_name).group(1)
+    @staticmethod
+    def _extract_block_name(variable_name):
+        """Get the ``name#counter`` block name from a variable name.
+
+        The block name may contain dots, so it is split at the ``#``
+        and the counter is taken up to the first dot that follows it.
+        """
+        name, sep, rest = variable_name.partition('#')
+        return name + sep + rest.partition('.')[0]
 
     def _prepare_outputs(self, outputs):
+        """Get the output variables index, the outputs list and the number of output blocks.
+
+        The output variables index maps the name of each block that produces outputs to
+        a dict with the positions that each one of its variables occupies in the outputs
+        list. When the whole context after a block is requested, the variable is ``None``.
+        """
         output_variables = self.get_output_variables(outputs)
-        outputs = output_variables.copy()
-        output_blocks = {
-            self._extract_block_name(variable)
-            for variable in output_variables
-        }
-        return output_variables, outputs, output_blocks
+        output_index = dict()
+        for index, variable in enumerate(output_variables):
+            block_name = self._extract_block_name(variable)
+            variable_name = variable[len(block_name) + 1:] or None
+            block_index = output_index.setdefault(block_name, dict())
+            block_index.setdefault(variable_name, []).append(index)
+
+        return output_index, output_variables, len(output_index)
 
     @staticmethod
     def _flatten_dict(hyperparameters):
@@ -440,18 +707,20 @@ class MLPipeline():
             dict:
                 A dictionary containing the block names as keys and
                 the block tunable hyperparameters dictionary as values.
+                Unless ``flat`` is ``True``, this is the dictionary held by
+                the pipeline, so it must not be modified.
         """
-        tunables = self._tunable_hyperparameters.copy()
         if flat:
-            tunables = self._flatten_dict(tunables)
+            return self._flatten_dict(self._tunable_hyperparameters)
 
-        return tunables
+        return self._tunable_hyperparameters
 
     @classmethod
     def _sanitize_value(cls, value):
-        """Convert numpy values to their python primitive type equivalent.
+        """Convert numpy scalars to their python primitive type equivalent.
 
         If a value is a dict, recursively sanitize its values.
+        Numpy arrays are left untouched.
 
         Args:
             value:
@@ -460,6 +729,10 @@ class MLPipeline():
         Returns:
             sanitized value.
         """
+        convert = _SCALAR_TYPES.get(type(value))
+        if convert is not None:
+            return convert(value)
+
         if isinstance(value, dict):
             return {
                 key: cls._sanitize_value(value)
@@ -469,15 +742,36 @@ class MLPipeline():
             return int(value)
         elif isinstance(value, np.floating):
             return float(value)
-        elif isinstance(value, np.ndarray):
-            return value.tolist()
-        elif isinstance(value, np.bool_):
-            return bool(value)
-        elif value == 'None':
+        elif isinstance(value, str) and value == 'None':
             return None
 
         return value
 
+    @classmethod
+    def _sanitize_value_for_json(cls, value):
+        """Convert numpy values, including arrays, to JSON serializable python types.
+
+        If a value is a dict or a list, recursively sanitize its values.
+
+        Args:
+            value:
+                value to sanitize.
+
+        Returns:
+            sanitized value.
+        """
+        if isinstance(value, dict):
+            return {
+                key: cls._sanitize_value_for_json(value)
+                for key, value in value.items()
+            }
+        if isinstance(value, list):
+            return [cls._sanitize_value_for_json(item) for item in value]
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+
+        return cls._sanitize_value(value)
+
     @classmethod
     def _sanitize(cls, hyperparameters):
         """Convert tuple hyperparameter keys to nested dicts.
@@ -506,6 +800,7 @@ class MLPipeline():
                 ...
             }
 
+        Both formats can be mixed in the same dict.
 
         Args:
             hyperparaeters (dict):
@@ -515,12 +810,15 @@ class MLPipeline():
             dict:
                 Sanitized dict.
         """
-        params_tree = defaultdict(dict)
+        params_tree = dict()
         for key, value in hyperparameters.items():
             value = cls._sanitize_value(value)
             if isinstance(key, tuple):
                 block, hyperparameter = key
-                params_tree[block][hyperparameter] = value
+                params_tree.setdefault(block, dict())[hyperparameter] = value
+            elif isinstance(value, dict):
+                # Merge with any hyperparameters given for this block in the tuple format
+                params_tree.setdefault(key, dict()).update(value)
             else:
                 params_tree[key] = value
 
@@ -542,9 +840,10 @@ class MLPipeline():
                 A dictionary containing the block names as keys and
                 the current block hyperparameters dictionary as values.
         """
-        hyperparameters = dict()
-        for block_name, block in self.blocks.items():
-            hyperparameters[block_name] = block.get_hyperparameters()
+        hyperparameters = {
+            block_name: block.get_hyperparameters()
+            for block_name, block in self.blocks.items()
+        }
 
         if flat:
             hyperparameters = self._flatten_dict(hyperparameters)
@@ -563,7 +862,7 @@ class MLPipeline():
         for block_name, block_hyperparams in hyperparameters.items():
             self.blocks[block_name].set_hyperparameters(block_hyperparams)
 
-    def _get_block_args(self, block_name, block_args, context):
+    def _get_block_args(self, block_name, block_args, context, variables_attr='produce_args'):
         """Get the arguments expected by the block method from the context.
 
         The arguments will be taken from the context using both the method
@@ -577,6 +876,9 @@ class MLPipeline():
                 list of method argument specifications from the primitive.
             context (dict):
                 current context dictionary.
+            variables_attr (str):
+                Name of the block attribute that ``block_args`` come from, either
+                ``fit_args`` or ``produce_args``. Defaults to ``produce_args``.
 
         Returns:
             dict:
@@ -585,67 +887,140 @@ class MLPipeline():
         """
         # TODO: type validation and/or transformation should be done here
 
-        input_names = self.input_names.get(block_name, dict())
+        input_names = self.input_names.get(block_name, _EMPTY_DICT)
+        plan = self._get_variables_plan(block_name, variables_attr, block_args, input_names)
+        return {name: context[variable] for name, variable in plan if variable in context}
+
+    def _get_variables_plan(self, block_name, variables_attr, variables, names):
+        """Get the names of some block variables paired with their context variable names.
+
+        A single plan is cached for each block and variables attribute, and it is
+        rebuilt when either the variables specification of the block or the given
+        names dictionary are replaced. Variables specified as the name of a primitive
+        method are computed by the primitive instance, so they are resolved on every call.
+
+        Args:
+            block_name (str):
+                Name of the block to which the variables belong.
+            variables_attr (str):
+                Name of the block attribute that has the variables list. It can be
+                `fit_args`, `produce_args` or `produce_output`.
+            variables (list or str):
+                The ``fit_args``, ``produce_args`` or ``produce_output`` of the block.
+            names (dict):
+                Dictionary used to translate the variable names.
 
-        if isinstance(block_args, str):
+        Returns:
+            tuple:
+                Pairs of variable name and context variable name.
+        """
+        if isinstance(variables, str):
             block = self.blocks[block_name]
-            block_args = getattr(block.instance, block_args)()
+            variables = getattr(block.instance, variables)()
+            cache_key = None
+        else:
+            cache_key = (block_name, variables_attr)
+            cached = self._variables_plans.get(cache_key)
+            if cached is not None and cached[0] is variables and cached[1] is names:
+                return cached[2]
+
+        plan = tuple(
+            (variable['name'], names.get(variable['name'], variable['name']))
+            for variable in variables
+        )
 
-        kwargs = dict()
-        for arg in block_args:
-            name = arg['name']
-            variable = input_names.get(name, name)
+        if cache_key is not None:
+            self._variables_plans[cache_key] = (variables, names, plan)
 
-            if variable in context:
-                kwargs[name] = context[variable]
+        return plan
 
-        return kwargs
+    def _build_variables_plans(self):
+        """Build the variables plans of all the blocks, so the first run does not have to."""
+        for block_name, block in self.blocks.items():
+            input_names = self.input_names.get(block_name, _EMPTY_DICT)
+            output_names = self.output_names.get(block_name, _EMPTY_DICT)
+            for variables_attr, names in (('fit_args', input_names),
+                                          ('produce_args', input_names),
+                                          ('produce_output', output_names)):
+                variables = getattr(block, variables_attr)
+                if not isinstance(variables, str):
+                    self._get_variables_plan(block_name, variables_attr, variables, names)
 
     def _extract_outputs(self, block_name, outputs, block_outputs):
         """Extract the outputs of the method as a dict to be set into the context."""
         # TODO: type validation and/or transformation should be done here
-        if isinstance(block_outputs, str):
-            block = self.blocks[block_name]
-            block_outputs = getattr(block.instance, block_outputs)()
+        output_names = self.output_names.get(block_name, _EMPTY_DICT)
+        plan = self._get_variables_plan(block_name, 'produce_output', block_outputs, output_names)
 
         if not isinstance(outputs, tuple):
             outputs = (outputs, )
 
-        elif len(outputs) != len(block_outputs):
-            error = 'Invalid number of outputs. Expected {} but got {}'.format(
-                len(block_outputs), len(outputs))
+        elif len(outputs) != len(plan):
+            error = f'Invalid number of outputs. Expected {len(plan)} but got {len(outputs)}'
 
             raise ValueError(error)
 
-        output_names = self.output_names.get(block_name, dict())
+        return {
+            output_name: output
+            for (_, output_name), output in zip(plan, outputs)
+        }
+
+    def _update_outputs(self, block_name, context, outputs_dict, output_index, outputs,
+                        copy_outputs=False):
+        """Set the requested block outputs into the outputs list in the right places.
+
+        The values are stored as they are, unless ``copy_outputs`` is ``True``,
+        in which case a shallow copy of them is stored instead.
+        """
+        for variable_name, indexes in output_index.get(block_name, _EMPTY_DICT).items():
+            if variable_name is None:
+                # Shallow snapshot: later blocks cannot add or replace its entries,
+                # but the values are shared, so changes made in place are seen.
+                value = dict(context)
+            elif variable_name in outputs_dict:
+                value = outputs_dict[variable_name]
+            else:
+                continue
+
+            if copy_outputs:
+                value = copy.copy(value)
 
-        output_dict = dict()
-        for output, block_output in zip(outputs, block_outputs):
-            name = block_output['name']
-            output_name = output_names.get(name, name)
-            output_dict[output_name] = output
+            for index in indexes:
+                outputs[index] = value
 
-        return output_dict
+    def _is_memoized(self, block_name):
+        """Tell whether the calls to the given block must be cached."""
+        if self.memory is None:
+            return False
 
-    def _update_outputs(self, variable_name, output_variables, outputs, value):
-        """Set the requested block outputs into the outputs list in the right place."""
-        if variable_name in output_variables:
-            index = output_variables.index(variable_name)
-            outputs[index] = deepcopy(value)
+        return self.memoize_steps is None or block_name in self.memoize_steps
 
     def _fit_block(self, block, block_name, context, debug_info=None):
-        """Get the block args from the context and fit the block."""
-        LOGGER.debug('Fitting block %s', block_name)
+        """Get the block args from the context and fit the block.
+
+        If the block is memoized, the fitted block may be loaded from the cache,
+        in which case it replaces the original one in ``self.blocks``.
+
+        Returns:
+            MLBlock:
+                The fitted block.
+        """
         try:
-            fit_args = self._get_block_args(block_name, block.fit_args, context)
-            process = psutil.Process(os.getpid())
-            memory_before = process.memory_info().rss
-            start = datetime.utcnow()
-            block.fit(**fit_args)
-            elapsed = datetime.utcnow() - start
-            memory_after = process.memory_info().rss
+            fit_args = self._get_block_args(block_name, block.fit_args, context, 'fit_args')
+            if debug_info is not None:
+                process = psutil.Process(os.getpid())
+                memory_before = process.memory_info().rss
+                start = datetime.utcnow()
+
+            if block.fit_method is not None and self._is_memoized(block_name):
+                block = self._fit_one(block, fit_args)
+                self.blocks[block_name] = block
+            else:
+                block.fit(**fit_args)
 
             if debug_info is not None:
+                elapsed = datetime.utcnow() - start
+                memory_after = process.memory_info().rss
                 debug = debug_info['debug']
                 record = {}
                 if 't' in debug:
@@ -657,39 +1032,48 @@ class MLPipeline():
 
                 debug_info['fit'][block_name] = record
 
+            return block
+
         except Exception:
             if self.verbose:
                 LOGGER.exception('Exception caught fitting MLBlock %s', block_name)
 
             raise
 
-    def _produce_block(self, block, block_name, context, output_variables,
-                       outputs, debug_info=None):
+    def _produce_block(self, block, block_name, context, output_index,
+                       outputs, debug_info=None, copy_outputs=False):
         """Get the block args from the context and produce the block.
 
         Afterwards, set the block outputs back into the context and update
         the outputs list if necessary.
+
+        Returns:
+            dict:
+                The outputs of the block, by context variable name.
         """
-        LOGGER.debug('Producing block %s', block_name)
         try:
-            produce_args = self._get_block_args(block_name, block.produce_args, context)
-            process = psutil.Process(os.getpid())
-            memory_before = process.memory_info().rss
-            start = datetime.utcnow()
-            block_outputs = block.produce(**produce_args)
-            elapsed = datetime.utcnow() - start
-            memory_after = process.memory_info().rss
+            produce_args = self._get_block_args(
+                block_name, block.produce_args, context, 'produce_args')
+            if debug_info is not None:
+                process = psutil.Process(os.getpid())
+                memory_before = process.memory_info().rss
+                start = datetime.utcnow()
+
+            if self._is_memoized(block_name):
+                block_outputs = self._produce_one(block, produce_args)
+            else:
+                block_outputs = block.produce(**produce_args)
+
+            if debug_info is not None:
+                elapsed = datetime.utcnow() - start
+                memory_after = process.memory_info().rss
 
             outputs_dict = self._extract_outputs(block_name, block_outputs, block.produce_output)
             context.update(outputs_dict)
 
-            if output_variables:
-                if block_name in output_variables:
-                    self._update_outputs(block_name, output_variables, outputs, context)
-                else:
-                    for key, value in outputs_dict.items():
-                        variable_name = '{}.{}'.format(block_name, key)
-                        self._update_outputs(variable_name, output_variables, outputs, value)
+            if output_index:
+                self._update_outputs(block_name, context, outputs_dict,
+                                     output_index, outputs, copy_outputs)
 
             if debug_info is not None:
                 debug = debug_info['debug']
@@ -705,13 +1089,32 @@ class MLPipeline():
 
                 debug_info['produce'][block_name] = record
 
+            return outputs_dict
+
         except Exception:
             if self.verbose:
                 LOGGER.exception('Exception caught producing MLBlock %s', block_name)
 
             raise
 
-    def fit(self, X=None, y=None, output_=None, start_=None, debug=False, **kwargs):
+    @staticmethod
+    def _build_context(X, y, kwargs):
+        """Build the context dictionary from the pipeline inputs.
+
+        ``kwargs`` is the dict of keyword arguments of the caller, which is a new
+        dict on every call, so it is used as the context instead of a copy.
+        """
+        context = kwargs
+        if X is not None:
+            context['X'] = X
+
+        if y is not None:
+            context['y'] = y
+
+        return context
+
+    def fit(self, X=None, y=None, output_=None, start_=None, debug=False,
+            copy_outputs=False, **kwargs):
         """Fit the blocks of this pipeline.
 
         Sequentially call the ``fit`` and the ``produce`` methods of each block,
@@ -755,6 +1158,14 @@ class MLPipeline():
                 This argument can be a string containing a combination of the letters listed above,
                 or ``True`` which will return a complete debug.
 
+            copy_outputs (bool):
+                If ``True``, return shallow copies of the requested outputs instead
+                of the values found in the context. Defaults to ``False``, in which
+                case the outputs are returned by reference, so any block which runs
+                after an output is captured and modifies it in place, such as an
+                array or a list, alters the returned value as well. The copies are
+                only one level deep, so nested values are still shared.
+
             **kwargs:
                 Any additional keyword arguments will be directly added
                 to the context dictionary and available for the blocks.
@@ -765,54 +1176,58 @@ class MLPipeline():
                 * If ``output_`` has been specified, either a single value or a
                   tuple of values will be returned.
         """
-        context = kwargs.copy()
-        if X is not None:
-            context['X'] = X
-
-        if y is not None:
-            context['y'] = y
+        context = self._build_context(X, y, kwargs)
 
         if output_ is None:
-            output_variables = None
+            output_index = None
             outputs = None
-            output_blocks = set()
+            pending_outputs = 0
         else:
-            output_variables, outputs, output_blocks = self._prepare_outputs(output_)
-
-        if isinstance(start_, int):
-            start_ = self._get_block_name(start_)
+            output_index, outputs, pending_outputs = self._prepare_outputs(output_)
 
         debug_info = None
         if debug:
             debug_info = defaultdict(dict)
             debug_info['debug'] = debug.lower() if isinstance(debug, str) else 'tmio'
 
+        blocks = self.blocks.items()
         fit_pending = True
-        for block_name, block in self.blocks.items():
-            if block_name == self._last_fit_block:
+        if start_ is not None:
+            start_index = self._get_start_index(start_)
+            blocks = islice(blocks, start_index, None)
+            last_fit_index = self._block_index.get(self._last_fit_block)
+            if last_fit_index is not None and last_fit_index < start_index:
                 fit_pending = False
 
-            if start_:
-                if block_name == start_:
-                    start_ = False
-                else:
-                    LOGGER.debug('Skipping block %s fit', block_name)
-                    continue
+        # Bind the attributes used on every iteration to locals
+        debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+        last_fit_block = self._last_fit_block
+        fit_block = self._fit_block
+        produce_block = self._produce_block
+        for block_name, block in blocks:
+            if block_name == last_fit_block:
+                fit_pending = False
+
+            if debug_enabled:
+                LOGGER.debug('Fitting block %s', block_name)
 
-            self._fit_block(block, block_name, context, debug_info)
+            block = fit_block(block, block_name, context, debug_info)
 
-            if fit_pending or output_blocks:
-                self._produce_block(
-                    block, block_name, context, output_variables, outputs, debug_info)
+            if fit_pending or pending_outputs:
+                if debug_enabled:
+                    LOGGER.debug('Producing block %s', block_name)
+
+                produce_block(block, block_name, context, output_index,
+                              outputs, debug_info, copy_outputs)
 
                 # We already captured the output from this block
-                if block_name in output_blocks:
-                    output_blocks.remove(block_name)
+                if output_index and block_name in output_index:
+                    pending_outputs -= 1
 
             # If there was an output_ but there are no pending
             # outputs we are done.
-            if output_variables:
-                if not output_blocks:
+            if output_index:
+                if not pending_outputs:
                     if len(outputs) > 1:
                         result = tuple(outputs)
                     else:
@@ -829,14 +1244,11 @@ class MLPipeline():
 
                 return
 
-        if start_:
-            # We skipped all the blocks up to the end
-            raise ValueError('Unknown block name: {}'.format(start_))
-
         if debug:
             return debug_info
 
-    def predict(self, X=None, output_='default', start_=None, debug=False, **kwargs):
+    def predict(self, X=None, output_='default', start_=None, debug=False,
+                copy_outputs=False, **kwargs):
         """Produce predictions using the blocks of this pipeline.
 
         Sequentially call the ``produce`` method of each block, capturing the
@@ -876,6 +1288,14 @@ class MLPipeline():
                 previously. If a ``string`` value with the combination of letters is given for
                 each option, it will return a dictionary with the selected elements.
 
+            copy_outputs (bool):
+                If ``True``, return shallow copies of the requested outputs instead
+                of the values found in the context. Defaults to ``False``, in which
+                case the outputs are returned by reference, so any block which runs
+                after an output is captured and modifies it in place, such as an
+                array or a list, alters the returned value as well. The copies are
+                only one level deep, so nested values are still shared.
+
             **kwargs:
                 Any additional keyword arguments will be directly added
                 to the context dictionary and available for the blocks.
@@ -888,37 +1308,36 @@ class MLPipeline():
                   returned are the predictions and the second a dictionary containing the debug
                   information.
         """
-        context = kwargs.copy()
-        if X is not None:
-            context['X'] = X
-
-        output_variables, outputs, output_blocks = self._prepare_outputs(output_)
+        context = self._build_context(X, None, kwargs)
 
-        if isinstance(start_, int):
-            start_ = self._get_block_name(start_)
+        output_index, outputs, pending_outputs = self._prepare_outputs(output_)
 
         debug_info = None
         if debug:
             debug_info = defaultdict(dict)
             debug_info['debug'] = debug.lower() if isinstance(debug, str) else 'tmio'
 
-        for block_name, block in self.blocks.items():
-            if start_:
-                if block_name == start_:
-                    start_ = False
-                else:
-                    LOGGER.debug('Skipping block %s produce', block_name)
-                    continue
+        blocks = self.blocks.items()
+        if start_ is not None:
+            blocks = islice(blocks, self._get_start_index(start_), None)
+
+        # Bind the attributes used on every iteration to locals
+        debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+        produce_block = self._produce_block
+        for block_name, block in blocks:
+            if debug_enabled:
+                LOGGER.debug('Producing block %s', block_name)
 
-            self._produce_block(block, block_name, context, output_variables, outputs, debug_info)
+            produce_block(block, block_name, context, output_index,
+                          outputs, debug_info, copy_outputs)
 
             # We already captured the output from this block
-            if block_name in output_blocks:
-                output_blocks.remove(block_name)
+            if block_name in output_index:
+                pending_outputs -= 1
 
             # If there was an output_ but there are no pending
             # outputs we are done.
-            if not output_blocks:
+            if not pending_outputs:
                 if len(outputs) > 1:
                     result = tuple(outputs)
                 else:
@@ -929,9 +1348,312 @@ class MLPipeline():
 
                 return result
 
-        if start_:
-            # We skipped all the blocks up to the end
-            raise ValueError('Unknown block name: {}'.format(start_))
+    async def apredict(self, X=None, **kwargs):
+        """Produce predictions without blocking the running event loop.
+
+        The ``predict`` method is run in the default executor of the event loop,
+        which allows awaiting multiple predictions concurrently.
+
+        Args:
+            X:
+                Data which the pipeline will use to make predictions.
+            **kwargs:
+                Any additional keyword arguments, including ``output_``, ``start_``
+                and ``debug``, will be passed to ``predict``.
+
+        Returns:
+            object or tuple:
+                The value returned by ``predict``.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.predict, X, **kwargs))
+
+    def predict_many(self, batch, n_workers=None):
+        """Produce multiple predictions concurrently using a thread pool.
+
+        Args:
+            batch (list[dict]):
+                List of dictionaries with the keyword arguments of each ``predict`` call.
+            n_workers (int):
+                Maximum number of threads to use. If not given, the
+                ``concurrent.futures.ThreadPoolExecutor`` default is used.
+
+        Returns:
+            list:
+                The value returned by each ``predict`` call, in the same order.
+        """
+        with ThreadPoolExecutor(n_workers) as executor:
+            return list(executor.map(lambda kwargs: self.predict(**kwargs), batch))
+
+    def _get_block_dependencies(self, block_names, fit):
+        """Get the blocks that each block has to wait for before being run.
+
+        A block depends on the previous blocks that write the context variables that
+        it reads, as well as on the previous blocks that read or write the variables
+        that it writes, so running the blocks in any order that respects these
+        dependencies gives the same results as running them sequentially.
+
+        The variables of the blocks whose arguments or outputs are computed by the
+        primitive at runtime are not known in advance, so these blocks depend on
+        all the previous blocks and all the following blocks depend on them.
+
+        The result is cached until the variables specification or the names
+        dictionaries of any of the blocks are replaced, so it must not be modified.
+
+        Args:
+            block_names (tuple):
+                Names of the blocks that will be run, in order.
+            fit (bool):
+                Whether the blocks will be fitted before being produced.
+
+        Returns:
+            tuple:
+                * A dict with the set of names of the blocks that each block depends on.
+                * A dict with the set of context variables read by each block, or
+                  ``None`` if they are not known in advance.
+        """
+        signature = list()
+        for block_name in block_names:
+            block = self.blocks[block_name]
+            signature.extend((
+                block.produce_args,
+                block.produce_output,
+                self.input_names.get(block_name, _EMPTY_DICT),
+                self.output_names.get(block_name, _EMPTY_DICT),
+            ))
+            if fit:
+                signature.append(block.fit_args)
+
+        cache_key = (block_names, fit)
+        cached = self._block_dependencies.get(cache_key)
+        if cached is not None and len(cached[0]) == len(signature):
+            if all(old is new for old, new in zip(cached[0], signature)):
+                return cached[1]
+
+        dependencies = dict()
+        block_reads = dict()
+        writers = dict()
+        readers = defaultdict(set)
+        barrier = None
+        for block_name in block_names:
+            block = self.blocks[block_name]
+            specs = [block.produce_args, block.produce_output]
+            if fit:
+                specs.append(block.fit_args)
+
+            if any(isinstance(spec, str) for spec in specs):
+                dependencies[block_name] = set(dependencies)
+                block_reads[block_name] = None
+                barrier = block_name
+                writers.clear()
+                readers.clear()
+                continue
+
+            input_names = self.input_names.get(block_name, _EMPTY_DICT)
+            reads = set(self._get_block_variables(block_name, 'produce_args', input_names))
+            if fit:
+                reads.update(self._get_block_variables(block_name, 'fit_args', input_names))
+
+            writes = self._get_block_variables(
+                block_name,
+                'produce_output',
+                self.output_names.get(block_name, _EMPTY_DICT)
+            )
+
+            upstream = {writers[name] for name in reads.union(writes) if name in writers}
+            for name in writes:
+                upstream.update(readers.pop(name, ()))
+                writers[name] = block_name
+
+            for name in reads:
+                readers[name].add(block_name)
+
+            if barrier:
+                upstream.add(barrier)
+
+            upstream.discard(block_name)
+            dependencies[block_name] = upstream
+            block_reads[block_name] = reads
+
+        self._block_dependencies[cache_key] = (signature, (dependencies, block_reads))
+        return dependencies, block_reads
+
+    @staticmethod
+    def _is_chain(block_names, dependencies):
+        """Tell whether each block depends on the one right before it."""
+        return all(
+            previous in dependencies[block_name]
+            for previous, block_name in zip(block_names, block_names[1:])
+        )
+
+    def _run_block(self, block_name, context, fit):
+        """Fit, if required, and produce a block. Used by the parallel runner."""
+        block = self.blocks[block_name]
+        if fit:
+            LOGGER.debug('Fitting block %s', block_name)
+            block = self._fit_block(block, block_name, context)
+
+        LOGGER.debug('Producing block %s', block_name)
+        return self._produce_block(block, block_name, context, None, None)
+
+    def _run_parallel(self, block_names, dependencies, block_reads, context, fit, n_workers):
+        """Run the given blocks in a thread pool following their dependencies.
+
+        The context is only read and updated from the calling thread: each block is
+        run on a context of its own that only contains the variables that it reads.
+
+        Returns:
+            dict:
+                The outputs of each block, by context variable name.
+        """
+        pending = dict()
+        downstream = defaultdict(list)
+        for block_name in block_names:
+            pending[block_name] = len(dependencies[block_name])
+            for upstream in dependencies[block_name]:
+                downstream[upstream].append(block_name)
+
+        def submit(executor, block_name):
+            reads = block_reads[block_name]
+            if reads is None:
+                block_context = dict(context)
+            else:
+                block_context = {name: context[name] for name in reads if name in context}
+
+            return executor.submit(self._run_block, block_name, block_context, fit)
+
+        block_outputs = dict()
+        with ThreadPoolExecutor(n_workers) as executor:
+            futures = {
+                submit(executor, block_name): block_name
+                for block_name in block_names
+                if not pending[block_name]
+            }
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    block_name = futures.pop(future)
+                    outputs_dict = future.result()
+                    context.update(outputs_dict)
+                    block_outputs[block_name] = outputs_dict
+
+                    for next_block in downstream[block_name]:
+                        pending[next_block] -= 1
+                        if not pending[next_block]:
+                            futures[submit(executor, next_block)] = next_block
+
+        return block_outputs
+
+    @staticmethod
+    def _check_parallel_kwargs(method_name, kwargs, unsupported):
+        """Raise a TypeError if any of the unsupported arguments is found in kwargs."""
+        for name in unsupported:
+            if name in kwargs:
+                raise TypeError(
+                    '{}() got an unexpected keyword argument {!r}'.format(method_name, name))
+
+    def fit_parallel(self, X=None, y=None, n_workers=None, **kwargs):
+        """Fit the blocks of this pipeline, running the independent ones concurrently.
+
+        The dependencies between the blocks are found by matching the context
+        variables that each one of them reads and writes, and the blocks are
+        fitted and produced in a thread pool as soon as the blocks that they
+        depend on have finished. The results are the same as the ones obtained
+        with ``fit``, which is used when no blocks can run concurrently.
+
+        Args:
+            X:
+                Fit Data, which the pipeline will learn from.
+            y:
+                Fit Data labels, which the pipeline will use to learn how to
+                behave.
+            n_workers (int):
+                Maximum number of threads to use. If not given, the
+                ``concurrent.futures.ThreadPoolExecutor`` default is used.
+            **kwargs:
+                Any additional keyword arguments will be directly added
+                to the context dictionary and available for the blocks.
+
+        Raises:
+            TypeError:
+                If any of the ``output_``, ``start_``, ``debug`` or ``copy_outputs``
+                arguments of ``fit`` is given, since they are not supported.
+        """
+        self._check_parallel_kwargs('fit_parallel', kwargs, _SEQUENTIAL_ARGUMENTS)
+        if self._last_fit_block is None:
+            block_names = self._block_names
+        else:
+            # The last block that needs fitting does not need to be produced
+            block_names = self._block_names[:self._block_index[self._last_fit_block]]
+
+        dependencies, block_reads = self._get_block_dependencies(block_names, fit=True)
+        if n_workers == 1 or self._is_chain(block_names, dependencies):
+            return self.fit(X, y, **kwargs)
+
+        context = self._build_context(X, y, kwargs)
+
+        self._run_parallel(block_names, dependencies, block_reads, context, True, n_workers)
+
+        if self._last_fit_block is not None:
+            LOGGER.debug('Fitting block %s', self._last_fit_block)
+            block = self.blocks[self._last_fit_block]
+            self._fit_block(block, self._last_fit_block, context)
+
+    def predict_parallel(self, X=None, output_='default', n_workers=None, **kwargs):
+        """Produce predictions, running the independent blocks concurrently.
+
+        The blocks are scheduled as in ``fit_parallel`` and the requested outputs
+        are the same as the ones returned by ``predict``, which is used when no
+        blocks can run concurrently.
+
+        Args:
+            X:
+                Data which the pipeline will use to make predictions.
+            output_ (str or int or list or None):
+                Output specification, as required by ``get_outputs``. If not specified
+                the ``default`` output will be returned.
+            n_workers (int):
+                Maximum number of threads to use. If not given, the
+                ``concurrent.futures.ThreadPoolExecutor`` default is used.
+            **kwargs:
+                Any additional keyword arguments will be directly added
+                to the context dictionary and available for the blocks.
+
+        Returns:
+            object or tuple:
+                * If a single output is requested, it is returned alone.
+                * If multiple outputs have been requested, a tuple is returned.
+
+        Raises:
+            TypeError:
+                If any of the ``start_``, ``debug`` or ``copy_outputs`` arguments
+                of ``predict`` is given, since they are not supported.
+        """
+        self._check_parallel_kwargs('predict_parallel', kwargs, _SEQUENTIAL_ARGUMENTS[1:])
+        output_index, outputs, _ = self._prepare_outputs(output_)
+        last_index = max(self._block_index[block_name] for block_name in output_index)
+        block_names = self._block_names[:last_index + 1]
+
+        dependencies, block_reads = self._get_block_dependencies(block_names, fit=False)
+        if n_workers == 1 or self._is_chain(block_names, dependencies):
+            return self.predict(X, output_, **kwargs)
+
+        context = self._build_context(X, None, kwargs)
+
+        # Replay the block outputs in order to capture the same values as ``predict``
+        replay_context = context.copy()
+        block_outputs = self._run_parallel(
+            block_names, dependencies, block_reads, context, False, n_workers)
+        for block_name in block_names:
+            outputs_dict = block_outputs[block_name]
+            replay_context.update(outputs_dict)
+            self._update_outputs(
+                block_name, replay_context, outputs_dict, output_index, outputs)
+
+        if len(outputs) > 1:
+            return tuple(outputs)
+
+        return outputs[0]
 
     def to_dict(self):
         """Return all the details of this MLPipeline in a dict.
@@ -978,7 +1700,7 @@ class MLPipeline():
             'init_params': self.init_params,
             'input_names': self.input_names,
             'output_names': self.output_names,
-            'hyperparameters': self.get_hyperparameters(),
+            'hyperparameters': self._sanitize_value_for_json(self.get_hyperparameters()),
             'tunable_hyperparameters': self._tunable_hyperparameters,
             'outputs': self.outputs,
         }
@@ -1040,7 +1762,7 @@ class MLPipeline():
                 output variable of the given block and its name is in the list of possible
                 output variables
         """
-        output_alt_names = self.output_names.get(block_name, dict())
+        output_alt_names = self.output_names.get(block_name, _EMPTY_DICT)
         relevant_output = set()
         for block_output in block.produce_output:
             output_variable_name = block_output['name']
@@ -1094,7 +1816,7 @@ class MLPipeline():
                 Dictionary of variable names and the set of tuples of blocks into which the
                 variable connects and the type of arrowhead to use
         """
-        input_alt_names = self.input_names.get(block_name, dict())
+        input_alt_names = self.input_names.get(block_name, _EMPTY_DICT)
         input_variables = set(variable['name'] for variable in block.produce_args)
 
         if fit:
@@ -1145,7 +1867,7 @@ class MLPipeline():
                 Dictionary of variable names and the set of tuples of blocks into which the
                 variable connects and the type of arrowhead to use
         """
-        output_alt_names = self.output_names.get(block_name, dict())
+        output_alt_names = self.output_names.get(block_name, _EMPTY_DICT)
         for output_name in output_names:
             output_block = block_name
             if output_name in output_alt_names.keys():
@@ -1191,13 +1913,12 @@ class MLPipeline():
                 input_variables.append(input_name_label)
 
                 for block, arrow in blocks:
-                    diagram.edge(input_name_label, block, pendwith='1', arrowhead=arrow)
+                    diagram.edge(input_name_label, block, arrowhead=arrow)
 
             with cluster.subgraph() as input_variables_subgraph:
                 input_variables_subgraph.attr(None, rank='same')
-                for index in range(1, len(input_variables)):
-                    input_variables_subgraph.edge(input_variables[index - 1],
-                                                  input_variables[index])
+                if len(input_variables) > 1:
+                    input_variables_subgraph.edges(zip(input_variables, input_variables[1:]))
                     input_variables_subgraph.attr(None, rankdir='LR')
 
     def _make_diagram_outputs(self, diagram, outputs):
@@ -1235,9 +1956,8 @@ class MLPipeline():
                 cluster.edge(output_variables[-1] + '_output', 'Output')
             with cluster.subgraph() as output_variables_subgraph:
                 output_variables_subgraph.attr(None, rank='same')
-                for index in range(1, len(output_variables)):
-                    output_variables_subgraph.edge(output_variables[index - 1] + '_output',
-                                                   output_variables[index] + '_output')
+                output_nodes = [variable + '_output' for variable in output_variables]
+                output_variables_subgraph.edges(zip(output_nodes, output_nodes[1:]))
                 output_variables_subgraph.attr(None, rankdir='LR')
 
         return output_variables
@@ -1298,7 +2018,8 @@ class MLPipeline():
 
         cluster_edges = set()
         variable_blocks = dict((name, {(name + '_output', 'normal')}) for name in output_variables)
-        for block_name, block in reversed(self.blocks.items()):
+        for block_name in reversed(self._block_names):
+            block = self.blocks[block_name]
             relevant_output_names = self._get_relevant_output_variables(block_name, block,
                                                                         variable_blocks.keys())
             if len(relevant_output_names) == 0:
@@ -1323,6 +2044,9 @@ class MLPipeline():
 
         The content of the JSON file is the dict returned by the ``to_dict`` method.
 
+        The standard ``json`` module is always used to write it, since ``orjson``
+        would write the ``NaN`` and ``Infinity`` hyperparameter values as ``null``.
+
         Args:
             path (str):
                 Path to the JSON file to write.
@@ -1372,7 +2096,17 @@ class MLPipeline():
             'Please use MLPipeline(path) instead,',
             DeprecationWarning
         )
-        with open(path, 'r') as in_file:
-            metadata = json.load(in_file)
+        with open(path, 'rb') as in_file:
+            metadata = _loads(in_file.read())
 
         return cls.from_dict(metadata)
+
+
+# Functions that build the pipeline dict, indexed by the type of the ``pipeline`` argument.
+_PIPELINE_DICT_BUILDERS = {
+    dict: lambda pipeline, primitives: pipeline,
+    str: lambda pipeline, primitives: load_pipeline(pipeline),
+    MLPipeline: lambda pipeline, primitives: pipeline.to_dict(),
+    list: _get_list_pipeline_dict,
+    type(None): _get_none_pipeline_dict,
+}
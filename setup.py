@@ -19,6 +19,15 @@ install_requires = [
 ]
 
 
+cache_requires = [
+    'joblib>=1,<2',
+]
+
+fast_requires = [
+    'orjson>=3,<4',
+]
+
+
 mlprimitives_requires = [
     'mlprimitives>=0.4.0,<0.5',
     'h5py<4,>=2.10.0',  # <- tensorflow 2.3.2 conflict
@@ -117,6 +126,8 @@ setup(
         'test': tests_require + examples_require,
         'examples': examples_require,
         'mlprimitives': mlprimitives_requires,
+        'cache': cache_requires,
+        'fast': fast_requires,
     },
     include_package_data=True,
     install_requires=install_requires,
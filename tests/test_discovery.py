@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import json
+import math
 import os
 import tempfile
 import uuid
@@ -59,6 +60,7 @@ def test_add_pipelines_path():
 
 
 @patch('mlblocks.discovery._PRIMITIVES_PATHS', new=['a', 'b'])
+@patch('mlblocks.discovery._ENTRY_POINT_PATHS', new=dict())
 @patch('mlblocks.discovery.pkg_resources.iter_entry_points')
 def test__load_entry_points_no_entry_points(iep_mock):
     # setup
@@ -75,6 +77,7 @@ def test__load_entry_points_no_entry_points(iep_mock):
     assert iep_mock.call_args_list == expected_calls
 
 
+@patch('mlblocks.discovery._ENTRY_POINT_PATHS', new=dict())
 @patch('mlblocks.discovery.pkg_resources.iter_entry_points')
 def test__load_entry_points_entry_points(iep_mock):
     # setup
@@ -113,6 +116,11 @@ def test__load_entry_points_entry_points(iep_mock):
     ]
     assert iep_mock.call_args_list == expected_calls
 
+    # the second call uses the cached paths
+    paths.append('modified')
+    assert discovery._load_entry_points('primitives') == expected
+    assert iep_mock.call_args_list == expected_calls
+
 
 @patch('mlblocks.discovery._PRIMITIVES_PATHS', new=['a', 'b'])
 @patch('mlblocks.discovery._load_entry_points')
@@ -163,6 +171,24 @@ def test__load_success():
         assert primitive == loaded
 
 
+def test__load_cached_path():
+    with tempfile.TemporaryDirectory() as tempdir:
+        paths = [tempdir]
+        primitive_path = os.path.join(tempdir, 'temp.primitive.json')
+        with open(primitive_path, 'w') as primitive_file:
+            json.dump({'name': 'temp.primitive'}, primitive_file)
+
+        discovery._load('temp.primitive', paths)
+        with patch('mlblocks.discovery.os.path.isfile', return_value=False) as isfile_mock:
+            loaded = discovery._load('temp.primitive', paths)
+
+        isfile_mock.assert_called_once_with('temp.primitive')
+        assert loaded == {'name': 'temp.primitive'}
+
+        os.remove(primitive_path)
+        assert discovery._load('temp.primitive', paths) is None
+
+
 def test__load_json_path():
     primitive = {
         'name': 'temp.primitive',
@@ -180,6 +206,41 @@ def test__load_json_path():
         assert primitive == loaded
 
 
+def test__load_json_nan():
+    with tempfile.TemporaryDirectory() as tempdir:
+        primitive_path = os.path.join(tempdir, 'temp.primitive.json')
+        with open(primitive_path, 'w') as primitive_file:
+            primitive_file.write('{"name": "temp.primitive", "default": NaN}')
+
+        loaded = discovery._load_json(primitive_path)
+
+    assert loaded['name'] == 'temp.primitive'
+    assert math.isnan(loaded['default'])
+
+
+def test__load_json_cached():
+    with tempfile.TemporaryDirectory() as tempdir:
+        primitive_path = os.path.join(tempdir, 'temp.primitive.json')
+        with open(primitive_path, 'w') as primitive_file:
+            json.dump({'name': 'temp.primitive'}, primitive_file)
+
+        first = discovery._load_json(primitive_path)
+        first['name'] = 'modified'
+        with patch('mlblocks.discovery.open', create=True) as open_mock:
+            second = discovery._load_json(primitive_path)
+
+        open_mock.assert_not_called()
+        assert second == {'name': 'temp.primitive'}
+
+        with open(primitive_path, 'w') as primitive_file:
+            json.dump({'name': 'other.primitive'}, primitive_file)
+
+        os.utime(primitive_path, ns=(0, 0))
+        third = discovery._load_json(primitive_path)
+
+    assert third == {'name': 'other.primitive'}
+
+
 @patch('mlblocks.discovery.get_primitives_paths')
 @patch('mlblocks.discovery._load')
 def test__load_primitive_value_error(load_mock, gpp_mock):
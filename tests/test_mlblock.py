@@ -34,6 +34,17 @@ class TestImportObject(TestCase):
 
         assert imported is dummy_function
 
+    @patch('mlblocks.mlblock.importlib.import_module')
+    def test_cached(self, import_module_mock):
+        first = import_object('a.cached.module.an_object')
+        second = import_object('a.cached.module.an_object')
+
+        assert first is second
+        import_module_mock.assert_called_once_with('a.cached.module')
+
+    def test_object(self):
+        assert import_object(dummy_function) is dummy_function
+
     def test_bad_object_name(self):
         with pytest.raises(AttributeError):
             import_object(__name__ + '.InvalidName')
@@ -493,6 +504,70 @@ class TestMLBlock(TestCase):
 
         assert 'b' not in hyperparameters['a_list_param']
 
+    @patch('mlblocks.mlblock.import_object', new=Mock())
+    @patch('mlblocks.mlblock.load_primitive', new=MagicMock())
+    def test__get_method_kwargs(self):
+        """The kwargs take precedence over the params, and the params over the defaults."""
+        mlblock = MLBlock('given_primitive_name')
+
+        method_args = [
+            {'name': 'a', 'keyword': 'a_keyword'},
+            {'name': 'b', 'default': 'b_default'},
+            {'name': 'c', 'default': 'c_default'},
+        ]
+        kwargs = {'a': 'a_kwarg', 'b': 'b_kwarg'}
+        params = {'b': 'b_param', 'c': 'c_param'}
+
+        method_kwargs = mlblock._get_method_kwargs(kwargs, method_args, params)
+
+        assert method_kwargs == {
+            'a_keyword': 'a_kwarg',
+            'b': 'b_kwarg',
+            'c': 'c_param',
+        }
+        assert kwargs == {'a': 'a_kwarg', 'b': 'b_kwarg'}
+
+    @patch('mlblocks.mlblock.import_object')
+    @patch('mlblocks.mlblock.load_primitive')
+    def test_set_hyperparameters_unchanged(self, lp_mock, io_mock):
+        """The primitive is only instantiated again if some hyperparameter changed."""
+        lp_mock.return_value = {
+            'name': 'a_primitive',
+            'primitive': 'a_primitive',
+            'produce': {
+                'method': 'produce',
+                'args': [],
+                'output': []
+            },
+            'hyperparameters': {
+                'tunable': {
+                    'a_param': {
+                        'type': 'int',
+                        'default': 1
+                    },
+                    'a_list_param': {
+                        'type': 'list',
+                        'default': ['a']
+                    }
+                }
+            }
+        }
+
+        mlblock = MLBlock('a_primitive')
+        io_mock.return_value.assert_called_once_with(a_param=1, a_list_param=['a'])
+
+        mlblock.set_hyperparameters({'a_param': 1})
+        assert io_mock.return_value.call_count == 1
+
+        mlblock.set_hyperparameters({'a_param': 1.0})
+        assert io_mock.return_value.call_count == 2
+
+        mlblock.set_hyperparameters({'a_param': 2})
+        assert io_mock.return_value.call_count == 3
+
+        mlblock.set_hyperparameters({'a_list_param': ['a']})
+        assert io_mock.return_value.call_count == 4
+
     def test_set_hyperparameters_function(self):
         pass
 
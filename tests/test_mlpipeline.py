@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
+import json
+import os
+import pickle
+import tempfile
 from collections import OrderedDict
 from unittest import TestCase
 from unittest.mock import MagicMock, call, patch
 
+import numpy as np
 import pytest
 
 from mlblocks.mlblock import MLBlock
@@ -14,6 +20,50 @@ def get_mlblock_mock(*args, **kwargs):
     return MagicMock(autospec=MLBlock)
 
 
+class CountingPrimitive():
+    """Primitive that counts how many times it has been called."""
+
+    calls = []
+
+    def fit(self, X):
+        self.calls.append('fit')
+        self.offset = len(X)
+
+    def produce(self, X):
+        self.calls.append('produce')
+        return [x + self.offset for x in X]
+
+
+COUNTING_PRIMITIVE = {
+    'name': 'counting_primitive',
+    'primitive': 'tests.test_mlpipeline.CountingPrimitive',
+    'fit': {
+        'method': 'fit',
+        'args': [
+            {
+                'name': 'X',
+                'type': 'list'
+            }
+        ]
+    },
+    'produce': {
+        'method': 'produce',
+        'args': [
+            {
+                'name': 'X',
+                'type': 'list'
+            }
+        ],
+        'output': [
+            {
+                'name': 'y',
+                'type': 'list'
+            }
+        ]
+    }
+}
+
+
 class TestMLPipline(TestCase):
 
     @patch('mlblocks.mlpipeline.LOGGER')
@@ -104,6 +154,21 @@ class TestMLPipline(TestCase):
             'a.primitive.Name'
         )
 
+    def test__get_pipeline_dict(self):
+        pipeline = OrderedDict(primitives=['a_primitive'])
+
+        assert MLPipeline._get_pipeline_dict(pipeline, None) is pipeline
+        assert MLPipeline._get_pipeline_dict(['a_primitive'], None) == {
+            'primitives': ['a_primitive']
+        }
+        assert MLPipeline._get_pipeline_dict(None, ['a_primitive']) == dict()
+
+        with pytest.raises(ValueError):
+            MLPipeline._get_pipeline_dict(['a_primitive'], ['a_primitive'])
+
+        with pytest.raises(ValueError):
+            MLPipeline._get_pipeline_dict(None, None)
+
     @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
     def test_get_tunable_hyperparameters(self):
         mlpipeline = MLPipeline(['a_primitive'])
@@ -112,8 +177,7 @@ class TestMLPipline(TestCase):
 
         returned = mlpipeline.get_tunable_hyperparameters()
 
-        assert returned == tunable
-        assert returned is not tunable
+        assert returned is tunable
 
     @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
     def test_get_tunable_hyperparameters_flat(self):
@@ -231,6 +295,21 @@ class TestMLPipline(TestCase):
         block_1.get_hyperparameters.assert_called_once_with()
         block_2.get_hyperparameters.assert_called_once_with()
 
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test_get_hyperparameters_block_changed(self):
+        """Hyperparameters set directly on a block are seen by the pipeline."""
+        block = get_mlblock_mock()
+        block.get_hyperparameters.return_value = {'a': 1}
+        mlpipeline = MLPipeline(['a_primitive'])
+        mlpipeline.blocks = OrderedDict((('a.primitive.Name#1', block), ))
+
+        assert mlpipeline.get_hyperparameters() == {'a.primitive.Name#1': {'a': 1}}
+
+        block.get_hyperparameters.return_value = {'a': 5}
+
+        assert mlpipeline.get_hyperparameters() == {'a.primitive.Name#1': {'a': 5}}
+        assert mlpipeline.to_dict()['hyperparameters'] == {'a.primitive.Name#1': {'a': 5}}
+
     @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
     def test_set_hyperparameters(self):
         block_1 = get_mlblock_mock()
@@ -309,6 +388,43 @@ class TestMLPipline(TestCase):
         }
         assert args == expected
 
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__get_variables_plan(self):
+        pipeline = MLPipeline(['a_primitive'])
+        names = {
+            'arg_2': 'arg_2_alt'
+        }
+        block_args = [
+            {
+                'name': 'arg_1',
+            },
+            {
+                'name': 'arg_2',
+            },
+        ]
+
+        plan = pipeline._get_variables_plan('a_block', 'fit_args', block_args, names)
+
+        assert plan == (('arg_1', 'arg_1'), ('arg_2', 'arg_2_alt'))
+        assert pipeline._get_variables_plan('a_block', 'fit_args', block_args, names) is plan
+        assert pipeline._get_variables_plan('a_block', 'fit_args', block_args, {}) == (
+            ('arg_1', 'arg_1'),
+            ('arg_2', 'arg_2')
+        )
+
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__get_variables_plan_replaced(self):
+        """Replacing the variables specification overwrites the cached plan."""
+        pipeline = MLPipeline(['a_primitive'])
+        pipeline._variables_plans.clear()
+
+        for _ in range(5):
+            block_args = [{'name': 'arg_1'}]
+            plan = pipeline._get_variables_plan('a_block', 'fit_args', block_args, {})
+
+        assert plan == (('arg_1', 'arg_1'), )
+        assert len(pipeline._variables_plans) == 1
+
     @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
     def test__get_outputs_no_outputs(self):
         self_ = MagicMock(autospec=MLPipeline)
@@ -412,6 +528,7 @@ class TestMLPipline(TestCase):
             }
         ]
         assert returned == expected
+        assert 'variable' not in pipeline.blocks['a_primitive#1'].produce_output[0]
 
     @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
     def test_get_outputs_str_block(self):
@@ -543,6 +660,147 @@ class TestMLPipline(TestCase):
 
         assert names == ['a_variable']
 
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__get_block_name(self):
+        pipeline = MLPipeline(['a_primitive', 'another_primitive'])
+
+        assert pipeline._get_block_name(0) == 'a_primitive#1'
+        assert pipeline._get_block_name(-1) == 'another_primitive#1'
+
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__get_start_index(self):
+        pipeline = MLPipeline(['a_primitive', 'another_primitive'])
+
+        assert pipeline._get_start_index('another_primitive#1') == 1
+        assert pipeline._get_start_index(-1) == 1
+
+        with pytest.raises(ValueError):
+            pipeline._get_start_index('invalid#1')
+
+    def test_fit_predict_start(self):
+        pipeline = MLPipeline([COUNTING_PRIMITIVE, COUNTING_PRIMITIVE])
+
+        CountingPrimitive.calls = []
+        pipeline.fit(X=[1, 2, 3], start_=1)
+        predictions = pipeline.predict(X=[1, 2], start_='counting_primitive#2')
+
+        assert predictions == [4, 5]
+        assert CountingPrimitive.calls == ['fit', 'produce']
+
+        with pytest.raises(ValueError):
+            pipeline.predict(X=[1, 2], start_='invalid#1')
+
+    def test__extract_block_name(self):
+        extract = MLPipeline._extract_block_name
+
+        assert extract('a_primitive#1') == 'a_primitive#1'
+        assert extract('a_primitive#1.a_variable') == 'a_primitive#1'
+        assert extract('a.dotted.primitive#12.a_variable') == 'a.dotted.primitive#12'
+
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__prepare_outputs(self):
+        outputs = {
+            'default': [
+                {
+                    'name': 'a_name',
+                    'variable': 'a_primitive#1.a_variable',
+                    'type': 'a_type',
+                },
+                {
+                    'name': 'a_context',
+                    'variable': 'a_primitive#1',
+                }
+            ]
+        }
+        pipeline = MLPipeline(['a_primitive'], outputs=outputs)
+
+        prepared = pipeline._prepare_outputs('default')
+
+        assert prepared == (
+            {'a_primitive#1': {'a_variable': [0], None: [1]}},
+            ['a_primitive#1.a_variable', 'a_primitive#1'],
+            1
+        )
+
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__prepare_outputs_outputs_replaced(self):
+        outputs = {
+            'default': [
+                {
+                    'name': 'a_name',
+                    'variable': 'a_primitive#1.a_variable',
+                }
+            ]
+        }
+        pipeline = MLPipeline(['a_primitive'], outputs=outputs)
+        pipeline._prepare_outputs('default')
+
+        pipeline.outputs = {
+            'default': [
+                {
+                    'name': 'another_name',
+                    'variable': 'a_primitive#1.another_variable',
+                }
+            ]
+        }
+        prepared = pipeline._prepare_outputs('default')
+
+        assert prepared == (
+            {'a_primitive#1': {'another_variable': [0]}},
+            ['a_primitive#1.another_variable'],
+            1
+        )
+
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__extract_outputs(self):
+        output_names = {
+            'a_primitive#1': {
+                'b': 'b_alt'
+            }
+        }
+        pipeline = MLPipeline(['a_primitive'], output_names=output_names)
+        block_outputs = [
+            {
+                'name': 'a',
+            },
+            {
+                'name': 'b',
+            },
+        ]
+
+        outputs = pipeline._extract_outputs('a_primitive#1', (1, 2), block_outputs)
+
+        assert outputs == {'a': 1, 'b_alt': 2}
+
+        with pytest.raises(ValueError):
+            pipeline._extract_outputs('a_primitive#1', (1, 2, 3), block_outputs)
+
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__update_outputs(self):
+        pipeline = MLPipeline(['a_primitive'])
+        value = [1, 2, 3]
+
+        context = {'X': value, 'a': value}
+        outputs_dict = {'a': value}
+        output_index = {
+            'a_primitive#1': {'a': [0, 2], 'b': [1], None: [3]},
+            'another_primitive#1': {'a': [4]},
+        }
+
+        outputs = [None, None, None, None, None]
+        pipeline._update_outputs('a_primitive#1', context, outputs_dict, output_index, outputs)
+
+        assert outputs == [value, None, value, context, None]
+        assert outputs[0] is value
+        assert outputs[3] is not context
+
+        outputs = [None, None, None, None, None]
+        pipeline._update_outputs('a_primitive#1', context, outputs_dict, output_index, outputs,
+                                 copy_outputs=True)
+
+        assert outputs == [value, None, value, context, None]
+        assert outputs[0] is not value
+
     @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
     def test__get_block_variables_is_dict(self):
         pipeline = MLPipeline(['a_primitive'])
@@ -594,6 +852,62 @@ class TestMLPipline(TestCase):
         assert outputs == expected
         pipeline.blocks['a_primitive#1'].instance.get_produce_outputs.assert_called_once_with()
 
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__get_block_variables_cached(self):
+        pipeline = MLPipeline(['a_primitive'])
+        names = {'output': 'name_output'}
+        pipeline.blocks['a_primitive#1'].produce_outputs = [
+            {
+                'name': 'output',
+                'type': 'whatever'
+            }
+        ]
+
+        first = pipeline._get_block_variables('a_primitive#1', 'produce_outputs', names)
+        second = pipeline._get_block_variables('a_primitive#1', 'produce_outputs', names)
+
+        assert first is second
+
+        pipeline.blocks['a_primitive#1'].produce_outputs = [
+            {
+                'name': 'another_output',
+                'type': 'whatever'
+            }
+        ]
+
+        third = pipeline._get_block_variables('a_primitive#1', 'produce_outputs', names)
+
+        expected = {
+            'another_output': {
+                'name': 'another_output',
+                'type': 'whatever',
+            }
+        }
+        assert third == expected
+
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__get_block_outputs(self):
+        pipeline = MLPipeline(['a_primitive'])
+        produce_output = [
+            {
+                'name': 'output',
+                'type': 'whatever'
+            }
+        ]
+        pipeline.blocks['a_primitive#1'].produce_output = produce_output
+
+        outputs = pipeline._get_block_outputs('a_primitive#1')
+
+        expected = [
+            {
+                'name': 'output',
+                'type': 'whatever',
+                'variable': 'a_primitive#1.output'
+            }
+        ]
+        assert outputs == expected
+        assert 'variable' not in produce_output[0]
+
     @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
     def test_get_inputs_fit(self):
         pipeline = MLPipeline(['a_primitive', 'another_primitive'])
@@ -690,6 +1004,16 @@ class TestMLPipline(TestCase):
         }
         assert inputs == expected
 
+    def test_get_inputs_blocks_replaced(self):
+        pipeline = MLPipeline([COUNTING_PRIMITIVE])
+        other = MLPipeline([COUNTING_PRIMITIVE, COUNTING_PRIMITIVE])
+
+        pipeline.blocks = other.blocks
+
+        assert pipeline.get_inputs() == other.get_inputs()
+        assert pipeline._block_index == {'counting_primitive#1': 0, 'counting_primitive#2': 1}
+        assert pipeline._last_block_name == 'counting_primitive#2'
+
     @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
     def test_get_fit_args(self):
         pipeline = MLPipeline(['a_primitive'])
@@ -1191,6 +1515,304 @@ class TestMLPipline(TestCase):
 
         assert str(pipeline.get_diagram()).strip() == expected.strip()
 
+    def test__get_memory_none(self):
+        assert MLPipeline._get_memory(None) is None
+
+    def test__get_memory_object(self):
+        memory = MagicMock()
+
+        assert MLPipeline._get_memory(memory) is memory
+
+    @patch('mlblocks.mlpipeline.joblib')
+    def test__get_memory_str(self, joblib_mock):
+        memory = MLPipeline._get_memory('a/path')
+
+        assert memory is joblib_mock.Memory.return_value
+        joblib_mock.Memory.assert_called_once_with(location='a/path', verbose=0)
+
+    def test__get_memory_invalid(self):
+        with pytest.raises(ValueError):
+            MLPipeline._get_memory(1)
+
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__is_memoized(self):
+        pipeline = MLPipeline(['a_primitive', 'another_primitive'])
+        assert not pipeline._is_memoized('a_primitive#1')
+
+        pipeline = MLPipeline(['a_primitive', 'another_primitive'], memory=MagicMock())
+        assert pipeline._is_memoized('a_primitive#1')
+        assert pipeline._is_memoized('another_primitive#1')
+
+        pipeline = MLPipeline(
+            ['a_primitive', 'another_primitive'],
+            memory=MagicMock(),
+            memoize_steps=['another_primitive#1']
+        )
+        assert not pipeline._is_memoized('a_primitive#1')
+        assert pipeline._is_memoized('another_primitive#1')
+
+    def test_fit_memory(self):
+        pytest.importorskip('joblib')
+        CountingPrimitive.calls = []
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pipeline = MLPipeline([COUNTING_PRIMITIVE], memory=tmp_dir)
+            pipeline.fit(X=[1, 2, 3])
+            first = pipeline.predict(X=[1, 2])
+
+            pipeline = MLPipeline([COUNTING_PRIMITIVE], memory=tmp_dir)
+            pipeline.fit(X=[1, 2, 3])
+            second = pipeline.predict(X=[1, 2])
+
+        assert first == [4, 5]
+        assert second == [4, 5]
+        assert CountingPrimitive.calls == ['fit', 'produce']
+
+    def test_fit_memory_dict(self):
+        pytest.importorskip('joblib')
+        CountingPrimitive.calls = []
+        store = dict()
+
+        pipeline = MLPipeline([COUNTING_PRIMITIVE], memory=store)
+        pipeline.fit(X=[1, 2, 3])
+        first = pipeline.predict(X=[1, 2])
+
+        pipeline = MLPipeline([COUNTING_PRIMITIVE], memory=store)
+        pipeline.fit(X=[1, 2, 3])
+        second = pipeline.predict(X=[1, 2])
+
+        pipeline.fit(X=[1, 2])
+        third = pipeline.predict(X=[1, 2])
+
+        assert first == [4, 5]
+        assert second == [4, 5]
+        assert third == [3, 4]
+        assert CountingPrimitive.calls == ['fit', 'produce', 'fit', 'produce']
+        assert len(store) == 4
+
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test__get_block_dependencies(self):
+        pipeline = MLPipeline(['a_primitive', 'a_primitive', 'a_primitive', 'a_primitive'])
+        specs = [
+            (['X'], ['a']),
+            (['X'], ['b']),
+            (['a', 'b'], ['X']),
+            ('get_args', ['c']),
+        ]
+        for block, (args, outputs) in zip(pipeline.blocks.values(), specs):
+            if not isinstance(args, str):
+                args = [{'name': name} for name in args]
+
+            block.produce_args = args
+            block.produce_output = [{'name': name} for name in outputs]
+
+        block_names = tuple(pipeline.blocks.keys())
+        dependencies, block_reads = pipeline._get_block_dependencies(block_names, fit=False)
+
+        assert dependencies == {
+            'a_primitive#1': set(),
+            'a_primitive#2': set(),
+            'a_primitive#3': {'a_primitive#1', 'a_primitive#2'},
+            'a_primitive#4': {'a_primitive#1', 'a_primitive#2', 'a_primitive#3'},
+        }
+        assert block_reads == {
+            'a_primitive#1': {'X'},
+            'a_primitive#2': {'X'},
+            'a_primitive#3': {'a', 'b'},
+            'a_primitive#4': None,
+        }
+        assert not pipeline._is_chain(block_names, dependencies)
+        assert pipeline._is_chain(block_names[1:], dependencies)
+
+        cached = pipeline._get_block_dependencies(block_names, fit=False)
+        assert cached[0] is dependencies
+
+        pipeline.blocks['a_primitive#2'].produce_output = [{'name': 'a'}]
+        dependencies, _ = pipeline._get_block_dependencies(block_names, fit=False)
+        assert dependencies['a_primitive#2'] == {'a_primitive#1'}
+
+    def test_predict_parallel(self):
+        CountingPrimitive.calls = []
+        pipeline = MLPipeline(
+            [COUNTING_PRIMITIVE, COUNTING_PRIMITIVE, COUNTING_PRIMITIVE],
+            output_names={
+                'counting_primitive#1': {'y': 'a'},
+                'counting_primitive#2': {'y': 'b'},
+            }
+        )
+        pipeline.fit_parallel(X=[1, 2, 3], n_workers=2)
+        outputs = ['counting_primitive#1', 'counting_primitive#2', 'default']
+        expected = pipeline.predict(X=[1, 2], output_=outputs)
+
+        CountingPrimitive.calls = []
+        result = pipeline.predict_parallel(X=[1, 2], output_=outputs, n_workers=2)
+
+        assert result == expected
+        assert result[0] == {'X': [1, 2], 'a': [4, 5]}
+        assert CountingPrimitive.calls == ['produce', 'produce', 'produce']
+
+    def test_fit_parallel_predict_parallel_unsupported_arguments(self):
+        CountingPrimitive.calls = []
+        pipeline = MLPipeline(
+            [COUNTING_PRIMITIVE, COUNTING_PRIMITIVE, COUNTING_PRIMITIVE],
+            output_names={
+                'counting_primitive#1': {'y': 'a'},
+                'counting_primitive#2': {'y': 'b'},
+            }
+        )
+
+        for name in ('output_', 'start_', 'debug', 'copy_outputs'):
+            with pytest.raises(TypeError):
+                pipeline.fit_parallel(X=[1, 2, 3], n_workers=2, **{name: 1})
+
+        pipeline.fit_parallel(X=[1, 2, 3], n_workers=2)
+        for name in ('start_', 'debug', 'copy_outputs'):
+            with pytest.raises(TypeError):
+                pipeline.predict_parallel(X=[1, 2], n_workers=2, **{name: 1})
+
+        assert sorted(CountingPrimitive.calls) == ['fit', 'fit', 'fit', 'produce', 'produce']
+
+    def test__sanitize_value(self):
+        array = np.array([1, 2])
+        value = {
+            'int': np.int64(1),
+            'float': np.float32(0.5),
+            'bool': np.bool_(True),
+            'none': 'None',
+            'array': array,
+            'str': 'a_value',
+        }
+
+        sanitized = MLPipeline._sanitize_value(value)
+
+        assert sanitized == {
+            'int': 1,
+            'float': 0.5,
+            'bool': True,
+            'none': None,
+            'array': array,
+            'str': 'a_value',
+        }
+        assert type(sanitized['int']) is int
+        assert type(sanitized['float']) is float
+        assert type(sanitized['bool']) is bool
+        assert sanitized['array'] is array
+
+    def test__sanitize(self):
+        hyperparameters = {
+            ('a_block', 'an_int'): np.int64(1),
+            'a_block': {
+                'a_float': np.float64(0.5),
+            },
+            'another_block': {
+                'a_str': 'None',
+            },
+            ('another_block', 'a_bool'): np.bool_(False),
+        }
+
+        sanitized = MLPipeline._sanitize(hyperparameters)
+
+        assert sanitized == {
+            'a_block': {
+                'an_int': 1,
+                'a_float': 0.5,
+            },
+            'another_block': {
+                'a_str': None,
+                'a_bool': False,
+            },
+        }
+
+    def test__sanitize_value_for_json(self):
+        value = {
+            'block': {
+                'int': np.int32(1),
+                'array': np.array([1, 2]),
+            }
+        }
+
+        sanitized = MLPipeline._sanitize_value_for_json(value)
+
+        assert sanitized == {
+            'block': {
+                'int': 1,
+                'array': [1, 2],
+            }
+        }
+        assert type(sanitized['block']['int']) is int
+
+    def test_pickle(self):
+        pipeline = MLPipeline([COUNTING_PRIMITIVE])
+        pipeline.fit(X=[1, 2, 3])
+
+        restored = pickle.loads(pickle.dumps(pipeline))
+
+        assert restored.predict(X=[1, 2]) == [4, 5]
+
+    def test_pickle_caches(self):
+        """The caches hold no unpicklable objects, even if they are pickled."""
+        pipeline = MLPipeline([COUNTING_PRIMITIVE])
+        pipeline.fit(X=[1, 2, 3])
+        pipeline.predict(X=[1, 2])
+
+        caches = {name: getattr(pipeline, name) for name in ('_block_variables',
+                                                             '_variables_plans')}
+
+        restored = pickle.loads(pickle.dumps(caches))
+
+        assert restored.keys() == caches.keys()
+
+    def test_pickle_memory(self):
+        pytest.importorskip('joblib')
+        pipeline = MLPipeline([COUNTING_PRIMITIVE], memory=dict())
+        pipeline.fit(X=[1, 2, 3])
+
+        state = pipeline.__getstate__()
+        restored = pickle.loads(pickle.dumps(pipeline))
+
+        assert 'memory' not in state
+        assert '_fit_one' not in state
+        assert restored.memory is None
+        assert restored.memoize_steps is None
+        assert restored.predict(X=[1, 2]) == [4, 5]
+
+    def test___setstate___legacy(self):
+        pipeline = MLPipeline([COUNTING_PRIMITIVE])
+        pipeline.fit(X=[1, 2, 3])
+        state = {
+            name: getattr(pipeline, name)
+            for name in ('primitives', 'init_params', 'blocks', 'input_names',
+                         'output_names', 'outputs', 'verbose', '_last_fit_block',
+                         '_last_block_name', '_tunable_hyperparameters')
+        }
+        state['_re_block_name'] = None
+
+        restored = MLPipeline.__new__(MLPipeline)
+        restored.__setstate__(state)
+
+        assert restored.predict(X=[1, 2]) == [4, 5]
+
+    def test_apredict(self):
+        pipeline = MLPipeline([COUNTING_PRIMITIVE])
+        pipeline.fit(X=[1, 2, 3])
+
+        async def predict_all():
+            return await asyncio.gather(
+                pipeline.apredict(X=[1, 2]),
+                pipeline.apredict([3], output_='counting_primitive#1.y'),
+            )
+
+        assert asyncio.run(predict_all()) == [[4, 5], [6]]
+
+    def test_predict_many(self):
+        pipeline = MLPipeline([COUNTING_PRIMITIVE])
+        pipeline.fit(X=[1, 2, 3])
+
+        batch = [{'X': [1, 2]}, {'X': [3]}, {'X': []}]
+        predictions = pipeline.predict_many(batch, n_workers=2)
+
+        assert predictions == [[4, 5], [6], []]
+
     def test_fit(self):
         pass
 
@@ -1200,11 +1822,82 @@ class TestMLPipline(TestCase):
     def test_to_dict(self):
         pass
 
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
     def test_save(self):
-        pass
+        pipeline = MLPipeline({
+            'primitives': ['a_primitive'],
+            'tunable_hyperparameters': {}
+        })
+        pipeline.blocks['a_primitive#1'].get_hyperparameters.return_value = {
+            'an_argument': 1
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'pipeline.json')
+            pipeline.save(path)
+
+            with open(path, 'r') as json_file:
+                saved = json.load(json_file)
+
+        assert saved == pipeline.to_dict()
+
+    @patch('mlblocks.mlpipeline.orjson', new=None)
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test_save_no_orjson(self):
+        pipeline = MLPipeline({
+            'primitives': ['a_primitive'],
+            'tunable_hyperparameters': {}
+        })
+        pipeline.blocks['a_primitive#1'].get_hyperparameters.return_value = {
+            'an_argument': 1
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'pipeline.json')
+            pipeline.save(path)
+
+            with open(path, 'r') as json_file:
+                saved = json.load(json_file)
+
+        assert saved == pipeline.to_dict()
+
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
+    def test_save_load_nan(self):
+        pipeline = MLPipeline({
+            'primitives': ['a_primitive'],
+            'tunable_hyperparameters': {}
+        })
+        pipeline.blocks['a_primitive#1'].get_hyperparameters.return_value = {
+            'missing_values': float('nan')
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'pipeline.json')
+            pipeline.save(path)
+
+            with pytest.warns(DeprecationWarning):
+                loaded = MLPipeline.load(path)
+
+        block = loaded.blocks['a_primitive#1']
+        hyperparameters = block.set_hyperparameters.call_args[0][0]
+        assert np.isnan(hyperparameters['missing_values'])
 
     def test_from_dict(self):
         pass
 
+    @patch('mlblocks.mlpipeline.MLBlock', new=get_mlblock_mock)
     def test_load(self):
-        pass
+        metadata = {
+            'primitives': ['a_primitive'],
+            'tunable_hyperparameters': {}
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'pipeline.json')
+            with open(path, 'w') as json_file:
+                json.dump(metadata, json_file)
+
+            with pytest.warns(DeprecationWarning):
+                pipeline = MLPipeline.load(path)
+
+        assert pipeline.primitives == ['a_primitive']